@@ -6,12 +6,66 @@
 import random
 import struct
 import sys
-from typing import List
+from typing import Callable, List
 
 # 导入log_parser中的帧格式配置
 import log_parser
 DEFAULT_FORMAT = log_parser.DEFAULT_FORMAT
 
+# 预编译的打包函数，避免每次调用时重新解析格式字符串
+_B = struct.Struct('B').pack
+_H = struct.Struct('>H').pack
+_H_LE = struct.Struct('<H').pack
+_I = struct.Struct('>I').pack
+_I_LE = struct.Struct('<I').pack
+_Q = struct.Struct('>Q').pack
+
+# 起始标记与长度字段之间的填充字节：如果LENGTH_FIELD_OFFSET > len(FRAME_START)，
+# 需要在两者之间填充其他信息（这里用0x00填充，实际使用时可以修改）
+_LENGTH_PADDING = b'\x00' * max(0, DEFAULT_FORMAT.LENGTH_FIELD_OFFSET - len(DEFAULT_FORMAT.FRAME_START))
+
+def _length_packer(fmt) -> Callable[[int], bytes]:
+    """根据帧格式配置选择长度字段的打包函数。"""
+    if fmt.LENGTH_FIELD_SIZE == 1:
+        return lambda length: _B(length & 0xFF)
+    elif fmt.LENGTH_FIELD_SIZE == 2:
+        return _H if fmt.LENGTH_FIELD_BIG_ENDIAN else _H_LE
+    elif fmt.LENGTH_FIELD_SIZE == 4:
+        return _I if fmt.LENGTH_FIELD_BIG_ENDIAN else _I_LE
+
+    # 处理其他大小的长度字段：超出字段宽度的高位被截断
+    size = fmt.LENGTH_FIELD_SIZE
+    mask = (1 << (size * 8)) - 1
+    byteorder = 'big' if fmt.LENGTH_FIELD_BIG_ENDIAN else 'little'
+    return lambda length: (length & mask).to_bytes(size, byteorder)
+
+def _timestamp_packer(size: int) -> Callable[[int], bytes]:
+    """根据时间戳大小选择生成大端字节的打包函数。"""
+    if size == 6:
+        # 6字节时间戳：使用8字节打包然后取后6字节
+        return lambda timestamp: _Q(timestamp)[8 - size:]
+    elif size == 4:
+        return _I
+    elif size == 8:
+        return _Q
+
+    # 其他大小：直接转换为大端字节，超出宽度的高位被截断
+    mask = (1 << (size * 8)) - 1
+    return lambda timestamp: (timestamp & mask).to_bytes(size, 'big')
+
+# 帧格式在运行期间固定，导入时选定一次打包函数，生成每帧时无需再做分支判断
+_pack_length = _length_packer(DEFAULT_FORMAT)
+_pack_timestamp = _timestamp_packer(DEFAULT_FORMAT.time_timestamp_size)
+
+# 随机二选一的候选项，复用同一元组，避免每次调用都新建列表
+_COIN = (True, False)
+
+def random_bytes(n: int) -> bytes:
+    """生成 n 个随机字节（等价于 Python 3.9+ 的 random.randbytes）。"""
+    if n <= 0:
+        return b''
+    return random.getrandbits(n * 8).to_bytes(n, 'little')
+
 def create_frame(payload: bytes, length_field_correct: bool = True) -> bytes:
     """
     使用给定的载荷创建帧。
@@ -24,79 +78,24 @@ def create_frame(payload: bytes, length_field_correct: bool = True) -> bytes:
         length = payload_len
     else:
         # 设置错误长度：更短或更长
-        if random.choice([True, False]):
+        if random.choice(_COIN):
             wrong_len = max(0, payload_len - random.randint(1, 5))
         else:
             wrong_len = payload_len + random.randint(1, 5)
         length = wrong_len
 
-    # 根据帧格式配置生成长度字段字节
-    if fmt.LENGTH_FIELD_SIZE == 1:
-        length_bytes = struct.pack('B', length & 0xFF)
-    elif fmt.LENGTH_FIELD_SIZE == 2:
-        if fmt.LENGTH_FIELD_BIG_ENDIAN:
-            length_bytes = struct.pack('>H', length)
-        else:
-            length_bytes = struct.pack('<H', length)
-    elif fmt.LENGTH_FIELD_SIZE == 4:
-        if fmt.LENGTH_FIELD_BIG_ENDIAN:
-            length_bytes = struct.pack('>I', length)
-        else:
-            length_bytes = struct.pack('<I', length)
-    else:
-        # 处理其他大小的长度字段
-        result = bytearray(fmt.LENGTH_FIELD_SIZE)
-        if fmt.LENGTH_FIELD_BIG_ENDIAN:
-            for i in range(fmt.LENGTH_FIELD_SIZE):
-                shift = (fmt.LENGTH_FIELD_SIZE - 1 - i) * 8
-                result[i] = (length >> shift) & 0xFF
-        else:
-            for i in range(fmt.LENGTH_FIELD_SIZE):
-                shift = i * 8
-                result[i] = (length >> shift) & 0xFF
-        length_bytes = bytes(result)
-
     # 构建帧：起始标记 + 其他信息（如果有）+ 长度字段 + 载荷 + 结束标记
-    # 注意：如果LENGTH_FIELD_OFFSET > len(FRAME_START)，需要在起始标记和长度字段之间填充其他信息
-    frame_parts = []
-    frame_parts.append(fmt.FRAME_START)
-
-    # 如果长度字段有偏移，添加填充字节（这里用0x00填充，实际使用时可以修改）
-    if fmt.LENGTH_FIELD_OFFSET > len(fmt.FRAME_START):
-        padding_size = fmt.LENGTH_FIELD_OFFSET - len(fmt.FRAME_START)
-        frame_parts.append(b'\x00' * padding_size)
-
-    frame_parts.append(length_bytes)
-    frame_parts.append(payload)
-    frame_parts.append(fmt.FRAME_END)
-
-    return b''.join(frame_parts)
+    # 各部分固定，直接一次拼接，无需中间列表
+    return b''.join((fmt.FRAME_START, _LENGTH_PADDING, _pack_length(length), payload, fmt.FRAME_END))
 
 def create_time_frame(timestamp: int = None) -> bytes:
     """创建时间帧。"""
     fmt = DEFAULT_FORMAT
     if timestamp is None:
         # 生成随机时间戳，适应时间戳大小
-        max_ts = (1 << (fmt.time_timestamp_size * 8)) - 1
-        timestamp = random.randint(0, max_ts)
-
-    # 根据时间戳大小生成长度合适的字节
-    if fmt.time_timestamp_size == 6:
-        # 6字节时间戳：使用8字节打包然后取后6字节
-        time_bytes = struct.pack('>Q', timestamp)[8 - fmt.time_timestamp_size:]
-    elif fmt.time_timestamp_size == 4:
-        time_bytes = struct.pack('>I', timestamp)
-    elif fmt.time_timestamp_size == 8:
-        time_bytes = struct.pack('>Q', timestamp)
-    else:
-        # 其他大小：手动构造大端字节
-        result = bytearray(fmt.time_timestamp_size)
-        for i in range(fmt.time_timestamp_size):
-            shift = (fmt.time_timestamp_size - 1 - i) * 8
-            result[i] = (timestamp >> shift) & 0xFF
-        time_bytes = bytes(result)
+        timestamp = random.getrandbits(fmt.time_timestamp_size * 8)
 
-    return fmt.TIME_MARKER + time_bytes
+    return fmt.TIME_MARKER + _pack_timestamp(timestamp)
 
 def generate_test_data() -> bytes:
     """生成包含各种场景的测试数据。"""
@@ -105,14 +104,14 @@ def generate_test_data() -> bytes:
     # 1. 一些有效帧
     print("Generating valid frames...")
     for i in range(5):
-        payload = f"Frame {i}: Test payload".encode('ascii')
+        payload = b"Frame %d: Test payload" % i
         frame = create_frame(payload, length_field_correct=True)
         data_parts.append(frame)
 
     # 2. 长度字段错误的帧
     print("Generating frames with incorrect length field...")
     for i in range(3):
-        payload = f"Bad length frame {i}".encode('ascii')
+        payload = b"Bad length frame %d" % i
         frame = create_frame(payload, length_field_correct=False)
         data_parts.append(frame)
 
@@ -120,7 +119,7 @@ def generate_test_data() -> bytes:
     print("Generating incomplete frames...")
     fmt = DEFAULT_FORMAT
     for i in range(2):
-        payload = f"Incomplete frame {i}".encode('ascii')
+        payload = b"Incomplete frame %d" % i
         # 使用正确的长度字段生成
         frame = create_frame(payload, length_field_correct=True)
         # 移除结束标记使其不完整
@@ -135,7 +134,7 @@ def generate_test_data() -> bytes:
 
     # 5. 帧之间的随机垃圾字节
     print("Adding garbage bytes...")
-    garbage = bytes([random.randint(0, 255) for _ in range(random.randint(1, 10))])
+    garbage = random_bytes(random.randint(1, 10))
     data_parts.append(garbage)
 
     # 打乱部分以混合所有内容
@@ -159,55 +158,32 @@ def generate_large_complex() -> bytes:
 
     # 1. 开头的垃圾数据（约100字节）
     print("生成开头垃圾数据...")
-    garbage_start = bytes([random.randint(0, 255) for _ in range(100)])
+    garbage_start = random_bytes(100)
     data_parts.append(garbage_start)
 
     # 2. 生成至少10个常规帧，帧之间夹杂垃圾数据和独立的时间帧
     print("生成常规帧...")
     for i in range(15):  # 15个帧
         # 随机决定是否在载荷中包含时间帧
-        if random.choice([True, False]):
+        if random.choice(_COIN):
             # 帧内穿插时间帧：在载荷中插入时间帧字节
-            payload = f"Frame {i} with time marker inside".encode('ascii')
+            payload = b"Frame %d with time marker inside" % i
             # 随机插入时间帧的字节（完整的时间帧）
             time_frame = create_time_frame(i * 1000)
             # 将时间帧字节插入到载荷的随机位置
             pos = random.randint(0, len(payload))
             payload = payload[:pos] + time_frame + payload[pos:]
         else:
-            payload = f"Frame {i} normal".encode('ascii')
+            payload = b"Frame %d normal" % i
 
         # 随机决定是否创建错帧（长度字段为最大值）
-        if random.choice([True, False]) and i % 3 == 0:  # 大约1/3的帧为错帧
+        if random.choice(_COIN) and i % 3 == 0:  # 大约1/3的帧为错帧
             # 错帧：长度字段设置为最大值（全1）
             max_length = (1 << (fmt.LENGTH_FIELD_SIZE * 8)) - 1
-            # 生成长度字段字节
-            if fmt.LENGTH_FIELD_SIZE == 1:
-                length_bytes = struct.pack('B', max_length)
-            elif fmt.LENGTH_FIELD_SIZE == 2:
-                if fmt.LENGTH_FIELD_BIG_ENDIAN:
-                    length_bytes = struct.pack('>H', max_length)
-                else:
-                    length_bytes = struct.pack('<H', max_length)
-            elif fmt.LENGTH_FIELD_SIZE == 4:
-                if fmt.LENGTH_FIELD_BIG_ENDIAN:
-                    length_bytes = struct.pack('>I', max_length)
-                else:
-                    length_bytes = struct.pack('<I', max_length)
-            else:
-                # 手动构造
-                length_bytes = bytes([0xFF] * fmt.LENGTH_FIELD_SIZE)
+            length_bytes = _pack_length(max_length)
 
             # 构建错帧
-            frame_parts = []
-            frame_parts.append(fmt.FRAME_START)
-            if fmt.LENGTH_FIELD_OFFSET > len(fmt.FRAME_START):
-                padding_size = fmt.LENGTH_FIELD_OFFSET - len(fmt.FRAME_START)
-                frame_parts.append(b'\x00' * padding_size)
-            frame_parts.append(length_bytes)
-            frame_parts.append(payload)
-            frame_parts.append(fmt.FRAME_END)
-            frame = b''.join(frame_parts)
+            frame = b''.join((fmt.FRAME_START, _LENGTH_PADDING, length_bytes, payload, fmt.FRAME_END))
 
             hex_length = length_bytes.hex()
             print(f"  创建错帧 {i}，长度字段={hex_length}")
@@ -218,20 +194,20 @@ def generate_large_complex() -> bytes:
         data_parts.append(frame)
 
         # 随机在帧后添加垃圾数据（1-20字节）
-        if random.choice([True, False]):
-            garbage = bytes([random.randint(0, 255) for _ in range(random.randint(1, 20))])
+        if random.choice(_COIN):
+            garbage = random_bytes(random.randint(1, 20))
             data_parts.append(garbage)
             print(f"  添加{len(garbage)}字节垃圾数据")
 
         # 随机在帧后添加独立的时间帧
-        if random.choice([True, False]):
+        if random.choice(_COIN):
             time_frame = create_time_frame(i * 500)
             data_parts.append(time_frame)
             print(f"  添加独立时间帧")
 
     # 3. 在末尾再添加一些垃圾数据
     print("生成末尾垃圾数据...")
-    garbage_end = bytes([random.randint(0, 255) for _ in range(50)])
+    garbage_end = random_bytes(50)
     data_parts.append(garbage_end)
 
     # 不打乱顺序，保持结构
@@ -262,7 +238,7 @@ def write_test_files():
         'large_frame': create_frame(b"X" * 1000),
         'zero_length_frame': create_frame(b""),
         'time_frame_series': b''.join([create_time_frame(i * 1000) for i in range(5)]),
-        'garbage_only': bytes([random.randint(0, 255) for _ in range(50)]),
+        'garbage_only': random_bytes(50),
         'empty_input': b'',
         'unicode_payload': create_frame("测试".encode('utf-8')),
         'multiple_time_frames_contiguous': b''.join([create_time_frame(0x123456 + i) for i in range(3)]),
@@ -7,19 +7,34 @@
 import argparse
 import sys
 import os
-import select
 import io
-import json
-import time
-from typing import Optional, BinaryIO, Iterator, Tuple
-
-# 尝试导入串口库，如果未安装则提供友好提示
-try:
-    import serial
-    import serial.tools.list_ports
-    SERIAL_AVAILABLE = True
-except ImportError:
-    SERIAL_AVAILABLE = False
+import mmap
+import struct
+from binascii import b2a_hex
+from typing import Optional, BinaryIO, Iterator, Tuple, Union
+
+def _load_serial():
+    """
+    按需导入串口库：pyserial 的导入链较长，只在使用串口功能时才加载，
+    文件与标准输入模式的启动不受影响。
+    未安装时返回 None，由调用方给出友好提示。
+    """
+    try:
+        import serial
+        import serial.tools.list_ports
+    except ImportError:
+        return None
+    return serial
+
+# 预编译的 Struct，避免每次解包时重新解析格式字符串
+_TS_STRUCT = struct.Struct('>Q')         # 8字节时间帧整体解包
+
+# struct 直接支持的长度字段宽度及其格式码
+_LENGTH_STRUCT_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+# 帧类型：find_next_frame 返回 (类型, 帧字节)
+KIND_FRAME = 0                           # 常规帧（包括无效帧）
+KIND_TIME = 1                            # 时间帧
 
 class FrameFormat:
     """
@@ -41,225 +56,351 @@ class FrameFormat:
     TIME_FRAME_LENGTH = 8                    # 时间帧总长度（字节）
     # 时间帧结构：TIME_MARKER (2字节) + 时间戳 (6字节)
 
-    # === 计算得到的属性 ===
-    @property
-    def min_frame_size(self) -> int:
-        """最小帧大小：起始 + 长度字段 + 最小载荷(0) + 结束"""
-        return (len(self.FRAME_START) +
-                self.LENGTH_FIELD_SIZE +
-                len(self.FRAME_END))
-
-    @property
-    def length_field_end(self) -> int:
-        """长度字段结束位置（相对于帧起始）"""
-        return self.LENGTH_FIELD_OFFSET + self.LENGTH_FIELD_SIZE
-
-    @property
-    def time_timestamp_size(self) -> int:
-        """时间帧中时间戳部分的大小"""
-        return self.TIME_FRAME_LENGTH - len(self.TIME_MARKER)
+    def __init__(self):
+        # === 计算得到的属性 ===
+        # 帧格式在实例生命周期内不变，创建时计算一次，解析时无需每次调用属性方法
+        # 最小帧大小：起始 + 长度字段 + 最小载荷(0) + 结束
+        self.min_frame_size = (len(self.FRAME_START) +
+                               self.LENGTH_FIELD_SIZE +
+                               len(self.FRAME_END))
+        # 长度字段结束位置（相对于帧起始）
+        self.length_field_end = self.LENGTH_FIELD_OFFSET + self.LENGTH_FIELD_SIZE
+        # 时间帧中时间戳部分的大小
+        self.time_timestamp_size = self.TIME_FRAME_LENGTH - len(self.TIME_MARKER)
+
+        # 按长度字段宽度与字节序预编译 Struct；struct 不支持的宽度（如3字节）为 None，
+        # 此时退回 int.from_bytes
+        code = _LENGTH_STRUCT_CODES.get(self.LENGTH_FIELD_SIZE)
+        if code is None:
+            self.length_struct = None
+        else:
+            self.length_struct = struct.Struct(('>' if self.LENGTH_FIELD_BIG_ENDIAN else '<') + code)
 
     def parse_length(self, length_bytes: bytes) -> int:
         """解析长度字段字节"""
-        if self.LENGTH_FIELD_SIZE == 2:
-            if self.LENGTH_FIELD_BIG_ENDIAN:
-                return (length_bytes[0] << 8) | length_bytes[1]
-            else:
-                return (length_bytes[1] << 8) | length_bytes[0]
-        elif self.LENGTH_FIELD_SIZE == 4:
-            if self.LENGTH_FIELD_BIG_ENDIAN:
-                return (length_bytes[0] << 24) | (length_bytes[1] << 16) | \
-                       (length_bytes[2] << 8) | length_bytes[3]
-            else:
-                return (length_bytes[3] << 24) | (length_bytes[2] << 16) | \
-                       (length_bytes[1] << 8) | length_bytes[0]
-        else:
-            # 处理1字节或3字节等不常见情况
-            result = 0
-            if self.LENGTH_FIELD_BIG_ENDIAN:
-                for i, byte in enumerate(length_bytes):
-                    result = (result << 8) | byte
-            else:
-                for i, byte in enumerate(reversed(length_bytes)):
-                    result = (result << 8) | byte
-            return result
+        if self.length_struct is not None:
+            return self.length_struct.unpack(length_bytes)[0]
+        # 处理3字节等 struct 不支持的宽度
+        return int.from_bytes(length_bytes, 'big' if self.LENGTH_FIELD_BIG_ENDIAN else 'little')
+
+    def unpack_length_from(self, data, offset: int = 0) -> int:
+        """
+        直接从数据中解析长度字段，offset 为帧起始在数据中的位置。
+        与 extract_length_field 不同，不会把长度字段复制为 bytes。
+        """
+        if len(data) - offset < self.length_field_end:
+            raise ValueError("数据不足，无法提取长度字段")
 
-    def extract_length_field(self, data: bytearray) -> Tuple[int, bytes]:
+        start_idx = offset + self.LENGTH_FIELD_OFFSET
+        if self.length_struct is not None:
+            return self.length_struct.unpack_from(data, start_idx)[0]
+        return int.from_bytes(data[start_idx:start_idx + self.LENGTH_FIELD_SIZE],
+                              'big' if self.LENGTH_FIELD_BIG_ENDIAN else 'little')
+
+    def extract_length_field(self, data: bytearray, offset: int = 0) -> Tuple[int, bytes]:
         """
-        从数据中提取长度字段。
+        从数据中提取长度字段，offset 为帧起始在数据中的位置。
         返回：(长度值, 长度字段字节)
         """
-        if len(data) < self.length_field_end:
+        if len(data) - offset < self.length_field_end:
             raise ValueError("数据不足，无法提取长度字段")
 
-        start_idx = self.LENGTH_FIELD_OFFSET
-        end_idx = self.length_field_end
+        start_idx = offset + self.LENGTH_FIELD_OFFSET
+        end_idx = offset + self.length_field_end
         length_bytes = bytes(data[start_idx:end_idx])
         length = self.parse_length(length_bytes)
         return length, length_bytes
 
+    def parse_timestamp(self, frame: bytes) -> int:
+        """解析时间帧中的时间戳（大端序）"""
+        start = len(self.TIME_MARKER)
+        if self.TIME_FRAME_LENGTH == _TS_STRUCT.size:
+            # 整个时间帧按8字节大端解包，再屏蔽高位的时间标记，无需切片
+            return _TS_STRUCT.unpack_from(frame)[0] & (0xFFFFFFFFFFFFFFFF >> (8 * start))
+        return int.from_bytes(frame[start:start + self.time_timestamp_size], 'big')
+
 # 默认帧格式实例
 DEFAULT_FORMAT = FrameFormat()
 
+# 已消费字节超过此阈值且超过缓冲区一半时才压缩缓冲区
+_COMPACT_THRESHOLD = 65536
+
+# process_stream 每次读取的字节数：文件等有限输入用大块读取以摊薄调用开销，
+# 串口与标准输入等实时数据源用小块读取以免长时间阻塞
+READ_CHUNK_SIZE = 65536
+STREAM_CHUNK_SIZE = 4096
+
 class LogParser:
+    # 固定的实例属性布局：属性读写直接按偏移访问，省去实例字典
+    __slots__ = ('frame_format', '_scan_constants', 'buffer', '_pos', '_view',
+                 'frames_found', 'time_frames_found', 'invalid_frames', 'bytes_processed')
+
     def __init__(self, frame_format: FrameFormat = None):
-        self.frame_format = frame_format or DEFAULT_FORMAT
+        self.frame_format = frame_format = frame_format or DEFAULT_FORMAT
+        # 帧格式在解析器生命周期内固定，预先算出 find_next_frame 用到的全部常量，
+        # 每次调用只需一次属性读取与元组解包，而不是逐个查找帧格式的属性
+        self._scan_constants = (
+            frame_format.FRAME_START,
+            frame_format.FRAME_END,
+            len(frame_format.FRAME_END),
+            frame_format.TIME_MARKER,
+            frame_format.TIME_MARKER[0],
+            len(frame_format.TIME_MARKER),
+            frame_format.TIME_FRAME_LENGTH,
+            frame_format.min_frame_size,
+            frame_format.length_struct,
+            frame_format.LENGTH_FIELD_OFFSET,
+            frame_format.length_field_end,
+            # 载荷之外的固定开销：起始到长度字段结束 + 结束标记
+            frame_format.length_field_end + len(frame_format.FRAME_END),
+            # 未找到标记时需保留的尾部字节数：可能是跨读取边界被截断的标记开头
+            max(len(frame_format.TIME_MARKER), len(frame_format.FRAME_START)) - 1,
+        )
         self.buffer = bytearray()
-        self.stats = {
-            'frames_found': 0,
-            'time_frames_found': 0,
-            'invalid_frames': 0,
-            'bytes_processed': 0,
+        self._pos = 0  # 缓冲区中未处理数据的起始位置
+        # 缓冲区的长期视图，用于一次拷贝提取帧；缓冲区改变大小前必须释放
+        self._view = memoryview(self.buffer)
+        # 统计计数保存为普通整数属性，热路径中只需一次属性读写
+        self.frames_found = 0
+        self.time_frames_found = 0
+        self.invalid_frames = 0
+        self.bytes_processed = 0
+
+    @property
+    def stats(self) -> dict:
+        """统计信息字典（按需构建）"""
+        return {
+            'frames_found': self.frames_found,
+            'time_frames_found': self.time_frames_found,
+            'invalid_frames': self.invalid_frames,
+            'bytes_processed': self.bytes_processed,
         }
 
-    def process_data(self, data: bytes):
+    def process_data(self, data: Union[bytes, bytearray, memoryview]):
         """处理传入的二进制数据。"""
+        # 缓冲区只能在没有导出视图时调整大小，释放后再重建
+        self._view.release()
+        self._compact()
         self.buffer.extend(data)
-        self.stats['bytes_processed'] += len(data)
+        self._view = memoryview(self.buffer)
+        self.bytes_processed += len(data)
+
+    def _compact(self):
+        """丢弃游标之前已处理的字节。
 
-    def find_next_frame(self) -> Optional[bytes]:
-        """从缓冲区查找并提取下一帧，移除已处理的字节。
-        返回帧字节，如果没有找到完整帧则返回None。
+        find_next_frame 只移动游标而不删除数据，避免每帧都 del 导致剩余数据
+        被反复搬移；这里仅在缓冲区已全部处理完，或已处理部分超过阈值且占缓冲区
+        一半以上时才真正删除，使搬移总量与输入总量成正比。
+        调用前必须先释放 self._view。
         """
-        fmt = self.frame_format
+        if self._pos >= len(self.buffer):
+            self.buffer.clear()
+            self._pos = 0
+        elif self._pos > _COMPACT_THRESHOLD and self._pos > len(self.buffer) // 2:
+            del self.buffer[:self._pos]
+            self._pos = 0
+
+    def find_next_frame(self) -> Optional[Tuple[int, bytes]]:
+        """从缓冲区查找并提取下一帧，将游标移过已处理的字节。
+        返回 (帧类型, 帧字节)，帧类型为 KIND_FRAME 或 KIND_TIME；
+        如果没有找到完整帧则返回None。
+        """
+        # 热路径中反复使用的属性与方法先绑定为局部变量，省去重复的属性查找
+        (frame_start, frame_end, frame_end_len, time_marker, time_marker_first,
+         time_marker_len, time_frame_length, min_frame_size, length_struct,
+         length_offset, length_field_end, frame_overhead, marker_tail) = self._scan_constants
+        buffer = self.buffer
+        find = buffer.find
+        view = self._view
+        pos = self._pos
+
+        # 快速路径：连续时间帧时游标处恰为时间标记，无需两次查找即可直接取帧
+        # （游标处的时间标记必然是最早的标记，结果与完整查找一致）。
+        # 先比较首字节排除绝大多数情况，再限定区间查找确认整个标记
+        # （缓冲区可能是 mmap，没有 startswith）
+        time_frame_end = pos + time_frame_length
+        if (time_frame_end <= len(buffer) and buffer[pos] == time_marker_first
+                and find(time_marker, pos, pos + time_marker_len) == pos):
+            self._pos = time_frame_end
+            self.time_frames_found += 1
+            return KIND_TIME, view[pos:time_frame_end].tobytes()
 
         # 查找时间标记或帧起始的最早出现位置
-        time_frame_idx = self.buffer.find(fmt.TIME_MARKER)
-        frame_start_idx = self.buffer.find(fmt.FRAME_START)
+        # 先查找帧起始（单字节时 find 使用 memchr，可按 SIMD 速度扫描），
+        # 再只在其之前的区间内查找时间标记，两次查找合计只扫描一遍数据
+        frame_start_idx = find(frame_start, pos)
+        if frame_start_idx == -1:
+            time_frame_idx = find(time_marker, pos)
+        else:
+            # 区间末尾包含 frame_start_idx 处，位置相同时时间标记优先
+            time_frame_idx = find(time_marker, pos, frame_start_idx + time_marker_len)
 
-        # 确定哪个标记最先出现（将-1视为未找到）
-        candidates = []
         if time_frame_idx != -1:
-            candidates.append(('time', time_frame_idx))
-        if frame_start_idx != -1:
-            candidates.append(('frame', frame_start_idx))
-
-        if not candidates:
-            # 未找到标记，清空缓冲区
-            self.buffer.clear()
+            marker_kind, marker_idx = KIND_TIME, time_frame_idx
+        elif frame_start_idx != -1:
+            marker_kind, marker_idx = KIND_FRAME, frame_start_idx
+        else:
+            # 未找到标记，丢弃已扫描的数据，但保留末尾可能是半个标记的字节
+            # （如时间标记的第一个 0xAA 恰好落在本次读取的末尾），
+            # 以免下一块数据到达后漏掉该标记
+            self._pos = max(pos, len(buffer) - marker_tail)
             return None
 
-        # 按位置排序
-        candidates.sort(key=lambda x: x[1])
-        marker_type, marker_idx = candidates[0]
-
-        # 移除第一个标记之前的任何数据
-        if marker_idx > 0:
-            del self.buffer[:marker_idx]
+        # 跳过第一个标记之前的任何数据
+        self._pos = pos = marker_idx
+        available = len(buffer) - pos
 
-        if marker_type == 'time':
+        if marker_kind == KIND_TIME:
             # 检查是否有足够的数据构成完整的时间帧
-            if len(self.buffer) >= fmt.TIME_FRAME_LENGTH:
-                time_frame = bytes(self.buffer[:fmt.TIME_FRAME_LENGTH])
-                del self.buffer[:fmt.TIME_FRAME_LENGTH]
-                self.stats['time_frames_found'] += 1
-                return time_frame
+            time_frame_end = pos + time_frame_length
+            if available >= time_frame_length:
+                time_frame = view[pos:time_frame_end].tobytes()
+                self._pos = time_frame_end
+                self.time_frames_found += 1
+                return KIND_TIME, time_frame
             # 数据不足，无法构成时间帧
             return None
         else:
-            # marker_type == 'frame'
+            # marker_kind == KIND_FRAME
             # 检查是否有最小帧所需的数据
-            if len(self.buffer) < fmt.min_frame_size:
+            if available < min_frame_size:
                 return None
 
             try:
                 # 提取长度字段
-                length, _ = fmt.extract_length_field(self.buffer)
-            except (ValueError, IndexError):
+                if length_struct is not None:
+                    # 常见宽度：直接从缓冲区解包，无需切片
+                    length = length_struct.unpack_from(buffer, pos + length_offset)[0]
+                else:
+                    length = self.frame_format.unpack_length_from(buffer, pos)
+            except (ValueError, IndexError, struct.error):
                 # 数据不足以提取长度字段，或者长度字段解析错误
                 # 尝试查找帧结束标记以恢复
-                end_idx = self.buffer.find(fmt.FRAME_END, len(fmt.FRAME_START))
-                if end_idx == -1:
-                    # 未找到结束标记，等待更多数据
-                    return None
-                # 提取到结束标记的帧
-                frame_end_idx = end_idx + len(fmt.FRAME_END)
-                frame_bytes = bytes(self.buffer[:frame_end_idx])
-                del self.buffer[:frame_end_idx]
-                self.stats['invalid_frames'] += 1
-                return frame_bytes
-
-            # 计算预期帧大小
-            # length_field_end 已经包含从帧开始到长度字段结束的所有字节
-            # 所以只需要：长度字段结束位置 + 载荷长度 + 帧结束标记长度
-            expected_frame_size = (
-                fmt.length_field_end +
-                length +
-                len(fmt.FRAME_END)
-            )
+                return self._take_invalid_frame(pos, pos + len(frame_start))
 
-            if len(self.buffer) < expected_frame_size:
-                # 根据长度字段，数据不足以构成完整帧
-                # 这可能是由于错误的长度字段或不完整的帧
-                # 尝试查找帧结束标记以恢复
-                end_idx = self.buffer.find(fmt.FRAME_END, fmt.length_field_end)
-                if end_idx == -1:
-                    # 未找到结束标记，等待更多数据
-                    return None
-                # 提取到结束标记的帧
-                frame_end_idx = end_idx + len(fmt.FRAME_END)
-                frame_bytes = bytes(self.buffer[:frame_end_idx])
-                del self.buffer[:frame_end_idx]
-                self.stats['invalid_frames'] += 1
-                return frame_bytes
-
-            # 检查帧是否在预期位置以正确的结束标记结束
-            frame_end_start = expected_frame_size - len(fmt.FRAME_END)
-            actual_end = bytes(self.buffer[frame_end_start:expected_frame_size])
-            if actual_end != fmt.FRAME_END:
-                # 在预期位置未找到正确的帧结束标记
-                # 这可能是由于长度字段错误
-                # 尝试查找下一个帧结束标记
-                end_idx = self.buffer.find(fmt.FRAME_END, fmt.length_field_end)
-                if end_idx == -1:
-                    # 未找到结束标记，等待更多数据
-                    return None
-                # 提取到结束标记的帧
-                frame_end_idx = end_idx + len(fmt.FRAME_END)
-                frame_bytes = bytes(self.buffer[:frame_end_idx])
-                del self.buffer[:frame_end_idx]
-                self.stats['invalid_frames'] += 1
-                return frame_bytes
+            # 计算预期帧大小：长度字段结束位置 + 载荷长度 + 帧结束标记长度，
+            # 其中与载荷无关的部分已预先合并为 frame_overhead
+            expected_frame_size = frame_overhead + length
 
-            # 找到完整帧
-            frame_bytes = bytes(self.buffer[:expected_frame_size])
-            del self.buffer[:expected_frame_size]
-            self.stats['frames_found'] += 1
-            return frame_bytes
+            # 检查数据是否足以构成完整帧，且帧在预期位置以正确的结束标记结束
+            # （通过视图比较结束标记，不复制缓冲区数据）
+            frame_end_idx = pos + expected_frame_size
+            if (available < expected_frame_size or
+                    view[frame_end_idx - frame_end_len:frame_end_idx] != frame_end):
+                # 数据不足或结束标记不匹配，可能是由于错误的长度字段或不完整的帧
+                # 尝试查找下一个帧结束标记以恢复
+                return self._take_invalid_frame(pos, pos + length_field_end)
 
-    def process_stream(self, input_stream: BinaryIO) -> Iterator[bytes]:
-        """处理输入流并生成找到的帧。"""
+            # 找到完整帧
+            frame_bytes = view[pos:frame_end_idx].tobytes()
+            self._pos = frame_end_idx
+            self.frames_found += 1
+            return KIND_FRAME, frame_bytes
+
+    def _take_invalid_frame(self, pos: int, search_from: int) -> Optional[Tuple[int, bytes]]:
+        """从 search_from 开始查找帧结束标记，将 pos 到该标记的数据作为无效帧提取。
+        未找到结束标记时返回None，等待更多数据。
+        """
+        frame_end = self.frame_format.FRAME_END
+        end_idx = self.buffer.find(frame_end, search_from)
+        if end_idx == -1:
+            # 未找到结束标记，等待更多数据
+            return None
+        # 提取到结束标记的帧
+        frame_end_idx = end_idx + len(frame_end)
+        frame_bytes = self._view[pos:frame_end_idx].tobytes()
+        self._pos = frame_end_idx
+        self.invalid_frames += 1
+        return KIND_FRAME, frame_bytes
+
+    def process_stream(self, input_stream: BinaryIO,
+                       chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Tuple[int, bytes]]:
+        """处理输入流并生成找到的帧，每项为 (帧类型, 帧字节)。
+        chunk_size 为每次读取的最大字节数。默认值适合串口、管道等实时数据源，
+        这类流的读取会阻塞到读满为止；文件等有限输入可传入 READ_CHUNK_SIZE 以减少读取次数。
+        """
+        # 复用同一个读缓冲区，避免每次 read() 分配新的 bytes 对象
+        read_buf = bytearray(chunk_size)
+        read_view = memoryview(read_buf)
+        readinto = getattr(input_stream, 'readinto', None)
         while True:
-            data = input_stream.read(4096)
-            if not data:
-                break
-            self.process_data(data)
-            while True:
-                frame = self.find_next_frame()
-                if frame is None:
+            if readinto is not None:
+                n = readinto(read_buf)
+                if not n:
                     break
-                yield frame
+                self.process_data(read_view[:n])
+            else:
+                data = input_stream.read(chunk_size)
+                if not data:
+                    break
+                self.process_data(data)
+            # iter(callable, sentinel) 在 C 层反复调用 find_next_frame，
+            # 直到返回 None，省去每帧的 Python 级循环与判断
+            yield from iter(self.find_next_frame, None)
 
         # 处理缓冲区中剩余的数据
-        while True:
-            frame = self.find_next_frame()
-            if frame is None:
-                break
-            yield frame
+        yield from iter(self.find_next_frame, None)
+
+    def process_buffer(self, data) -> Iterator[Tuple[int, bytes]]:
+        """就地解析一块完整的数据（如 mmap 映射的文件）并生成找到的帧。
+        数据不会被复制到内部缓冲区；结束后未处理的尾部数据会保留在内部缓冲区中。
+        """
+        if self._pos < len(self.buffer):
+            # 内部缓冲区仍有未处理数据，只能追加后按常规方式解析
+            self.process_data(data)
+            yield from iter(self.find_next_frame, None)
+            return
+
+        self._view.release()
+        self.buffer = data
+        self._view = memoryview(data)
+        self._pos = 0
+        self.bytes_processed += len(data)
+        try:
+            yield from iter(self.find_next_frame, None)
+        finally:
+            # 把剩余数据复制回内部缓冲区，并释放对外部数据的引用
+            rest = self._view[self._pos:].tobytes()
+            self._view.release()
+            self.buffer = bytearray(rest)
+            self._view = memoryview(self.buffer)
+            self._pos = 0
+
+# hex_to_bytes 需要删除的字符：str.split() 视为空白的全部字符，以及冒号
+_HEX_STRIP_TABLE = str.maketrans('', '', (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+    ':'))
 
 def hex_to_bytes(hex_str: str) -> bytes:
     """将十六进制字符串转换为字节，处理空格和可选的0x前缀。"""
     hex_str = hex_str.strip()
     if hex_str.startswith('0x'):
         hex_str = hex_str[2:]
-    # 移除所有空格或冒号
-    hex_str = ''.join(hex_str.split())
-    hex_str = hex_str.replace(':', '')
+    # 一次 translate 移除所有空白与冒号，不再逐步生成中间字符串
+    hex_str = hex_str.translate(_HEX_STRIP_TABLE)
     try:
         return bytes.fromhex(hex_str)
     except ValueError as e:
         raise ValueError(f"Invalid hex string: {e}")
 
+# 非实时输入时，每累积多少帧的输出写一次标准输出
+_OUTPUT_BATCH_SIZE = 256
+
+# 行结束符：输出绕过文本层，需自行使用平台换行符（Windows 上为 CRLF），
+# 与经由 print 输出时一致
+_NEWLINE = os.linesep.encode('ascii')
+
+# 按帧类型索引的输出模板；所有输出格式都直接生成字节写到 sys.stdout.buffer。
+# JSON 各字段只有固定类型名、十六进制串和整数，无需转义，
+# 按模板格式化的结果与 json.dumps 输出逐字节一致
+_TEXT_PREFIX = (b'FRAME: ', b'TIME_FRAME: ')
+_TEXT_TIMESTAMP = b'%s%s (timestamp: %d)' + _NEWLINE
+_JSON_LINE = (b'{"type": "frame", "hex": "%s", "length": %d}' + _NEWLINE,
+              b'{"type": "time_frame", "hex": "%s", "length": %d}' + _NEWLINE)
+_JSON_TIMESTAMP_LINE = b'{"type": "time_frame", "hex": "%s", "length": %d, "timestamp": %d}' + _NEWLINE
+
 def main():
     parser = argparse.ArgumentParser(
         description='解析带时间标记的二进制日志帧。',
@@ -312,7 +453,8 @@ def main():
 
     # 处理 --list-ports 选项
     if args.list_ports:
-        if not SERIAL_AVAILABLE:
+        serial = _load_serial()
+        if serial is None:
             print("错误：pyserial 库未安装，无法列出串口。", file=sys.stderr)
             print("请使用 pip install pyserial 安装。", file=sys.stderr)
             sys.exit(1)
@@ -342,7 +484,8 @@ def main():
 
     if args.port:
         # 串口输入
-        if not SERIAL_AVAILABLE:
+        serial = _load_serial()
+        if serial is None:
             print("错误：pyserial 库未安装，无法使用串口功能。", file=sys.stderr)
             print("请使用 pip install pyserial 安装。", file=sys.stderr)
             sys.exit(1)
@@ -392,7 +535,8 @@ def main():
             sys.exit(1)
     elif args.file:
         try:
-            input_stream = open(args.file, 'rb')
+            # 无缓冲打开：readinto 直接读入解析器的读缓冲区，不经过 BufferedReader 中转
+            input_stream = open(args.file, 'rb', buffering=0)
         except FileNotFoundError:
             print(f"Error: File not found: {args.file}", file=sys.stderr)
             sys.exit(1)
@@ -418,41 +562,79 @@ def main():
     # Create parser
     parser_inst = LogParser()
 
+    # 输出直接写字节到 sys.stdout.buffer，绕过文本层编码；先清空文本层中已有的输出
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+
+    # 输出先缓存再批量写入，避免每帧一次 print 的写调用与锁开销。
+    # 串口与标准输入（如 cat /dev/ttyUSB0 | ...）是实时数据源，标准输出为终端时
+    # 逐帧写出并立即刷新以免延迟显示（与 print 在终端上按行刷新一致）；
+    # 输出重定向到文件或管道时仍批量写入
+    live_input = not (args.file or args.hex is not None)
+    line_buffered = live_input and out.isatty()
+    flush_every = 1 if line_buffered else _OUTPUT_BATCH_SIZE
+    pending = []
+
+    def flush_output():
+        if pending:
+            data = b''.join(pending)
+            # 写之前先清空：写入失败（如下游管道已关闭）时，finally 中不会重复写同一批数据
+            pending.clear()
+            out.write(data)
+            if line_buffered:
+                out.flush()
+
+    # 文件输入优先使用 mmap 就地解析，省去 read 调用和向解析缓冲区的复制；
+    # 空文件或不支持映射的文件（如管道、设备）仍按流读取
+    mapped = None
+    if args.file:
+        try:
+            mapped = mmap.mmap(input_stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None
+        if mapped is not None and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            # 顺序访问提示：内核提前预读后续页面，磁盘读取与解析重叠进行
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+    if mapped is not None:
+        frames = parser_inst.process_buffer(mapped)
+    elif args.file or args.hex is not None:
+        # 有限输入，可以大块读取
+        frames = parser_inst.process_stream(input_stream, READ_CHUNK_SIZE)
+    else:
+        frames = parser_inst.process_stream(input_stream, STREAM_CHUNK_SIZE)
+
     # Process input
     try:
-        for frame in parser_inst.process_stream(input_stream):
+        for kind, frame in frames:
             if args.output == 'raw':
-                sys.stdout.buffer.write(frame)
+                pending.append(frame)
             elif args.output == 'hex':
-                print(frame.hex())
+                pending.append(b2a_hex(frame) + _NEWLINE)
             elif args.output == 'json':
                 # JSON output
-                frame_info = {
-                    'type': 'time_frame' if frame.startswith(DEFAULT_FORMAT.TIME_MARKER) else 'frame',
-                    'hex': frame.hex(),
-                    'length': len(frame)
-                }
-                if frame.startswith(DEFAULT_FORMAT.TIME_MARKER) and args.parse_time:
+                if kind == KIND_TIME and args.parse_time:
                     # Parse timestamp (big-endian)
-                    timestamp_start = len(DEFAULT_FORMAT.TIME_MARKER)
-                    timestamp_end = timestamp_start + DEFAULT_FORMAT.time_timestamp_size
-                    timestamp = int.from_bytes(frame[timestamp_start:timestamp_end], 'big')
-                    frame_info['timestamp'] = timestamp
-                print(json.dumps(frame_info))
+                    timestamp = DEFAULT_FORMAT.parse_timestamp(frame)
+                    pending.append(_JSON_TIMESTAMP_LINE % (b2a_hex(frame), len(frame), timestamp))
+                else:
+                    pending.append(_JSON_LINE[kind] % (b2a_hex(frame), len(frame)))
             else:  # text output (default)
-                if frame.startswith(DEFAULT_FORMAT.TIME_MARKER):
-                    if args.parse_time:
-                        timestamp_start = len(DEFAULT_FORMAT.TIME_MARKER)
-                        timestamp_end = timestamp_start + DEFAULT_FORMAT.time_timestamp_size
-                        timestamp = int.from_bytes(frame[timestamp_start:timestamp_end], 'big')
-                        print(f"TIME_FRAME: {frame.hex()} (timestamp: {timestamp})")
-                    else:
-                        print(f"TIME_FRAME: {frame.hex()}")
+                if kind == KIND_TIME and args.parse_time:
+                    timestamp = DEFAULT_FORMAT.parse_timestamp(frame)
+                    pending.append(_TEXT_TIMESTAMP % (_TEXT_PREFIX[kind], b2a_hex(frame), timestamp))
                 else:
-                    print(f"FRAME: {frame.hex()}")
+                    pending.append(_TEXT_PREFIX[kind] + b2a_hex(frame) + _NEWLINE)
+            if len(pending) >= flush_every:
+                flush_output()
     except KeyboardInterrupt:
         pass
     finally:
+        flush_output()
+        if mapped is not None:
+            # 先结束生成器以释放其持有的内存视图，才能关闭映射
+            frames.close()
+            mapped.close()
         if (args.file or args.port) and input_stream:
             input_stream.close()
 